@@ -1,14 +1,154 @@
 import math
-import random
 import os
+import logging
+import numpy as np
 from weather import Weather
 from weather_api import WeatherAPI
-from functools import lru_cache
+from functools import lru_cache, cached_property
 from collections import namedtuple
 from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+_LOG = logging.getLogger(__name__)
 
 Coordinate = namedtuple("Coordinate", ["lat", "lon"])
 
+_EARTH_RADIUS_KM = 6371
+
+_TAXI_H = 10 / 60  # 10 minutes in hours
+_CLIMB_H = 15 / 60  # 15 minutes in hours
+_DESCENT_H = 15 / 60  # 15 minutes in hours
+_CLIMB_DESCENT_H = _CLIMB_H + _DESCENT_H
+_FIXED_OVERHEAD_H = _TAXI_H + _CLIMB_DESCENT_H
+# Climb and descent are flown at half the cruise speed on average
+_CLIMB_DESCENT_HALF_H = _CLIMB_DESCENT_H / 2
+
+# Below this many points the per-point checks are faster than the NumPy version
+_BATCH_VALIDATION_MIN_POINTS = 32
+
+# Upper bound on concurrent weather requests, as in WeatherAPI.get_weather_many
+_PREFETCH_MAX_WORKERS = 16
+
+_POINT_NAMES = {
+    (40.4168, -3.7038): "Madrid",
+    (41.6528, -4.7245): "Valladolid",
+    (40.9429, -4.1088): "Segovia",
+}
+
+
+def _has_four_decimals(value):
+    """
+    Indica si un flotante se escribe exactamente con 4 decimales (p. ej. 40.4168, no 40.417).
+
+    Equivale a contar los decimales de `str(value)`, pero sin crear cadenas intermedias:
+    el valor tiene como mucho 4 decimales si redondearlo a 4 lo deja igual, y exactamente 4
+    si además redondearlo a 3 lo cambia.
+    """
+    return (
+        round(value * 10000) / 10000 == value and round(value * 1000) / 1000 != value
+    )
+
+
+def _haversine_kernel(lat1, lon1, lat2, lon2):
+    """
+    Fórmula del haversine sobre cuatro flotantes en grados. Devuelve la distancia en km.
+    """
+    lat1, lon1 = math.radians(lat1), math.radians(lon1)
+    lat2, lon2 = math.radians(lat2), math.radians(lon2)
+
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+
+    a = (
+        math.sin(dlat / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
+    )
+    c = 2 * math.asin(math.sqrt(min(1.0, a)))
+
+    return _EARTH_RADIUS_KM * c
+
+
+def _bearing_kernel(lat1, lon1, lat2, lon2):
+    """
+    Rumbo inicial (0-360 grados) entre dos puntos dados como cuatro flotantes en grados.
+    """
+    lat1, lon1 = math.radians(lat1), math.radians(lon1)
+    lat2, lon2 = math.radians(lat2), math.radians(lon2)
+
+    dlon = lon2 - lon1
+
+    y = math.sin(dlon) * math.cos(lat2)
+    x = math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * math.cos(
+        lat2
+    ) * math.cos(dlon)
+
+    initial_bearing = math.degrees(math.atan2(y, x))
+
+    return (initial_bearing + 360) % 360
+
+
+_Kernels = namedtuple("_Kernels", ["haversine", "bearing", "haversine_many"])
+
+
+@lru_cache(maxsize=1)
+def _kernels():
+    """
+    Devuelve los kernels de distancia y rumbo, compilados con Numba si está instalado.
+
+    Numba se importa la primera vez que se necesitan los kernels, no al cargar el módulo,
+    igual que en `weather._impact_kernel`. Sin Numba se devuelven las versiones en Python y
+    `haversine_many` es None, de modo que `FlightPlan.haversine_array` usa NumPy.
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return _Kernels(_haversine_kernel, _bearing_kernel, None)
+
+    haversine = njit(cache=True, fastmath=True)(_haversine_kernel)
+    bearing = njit(cache=True, fastmath=True)(_bearing_kernel)
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def haversine_many(lats, lons):
+        """
+        Distancias de los tramos consecutivos de una ruta, repartidas entre hilos con `prange`.
+        """
+        out = np.empty(lats.shape[0] - 1)
+        for i in prange(lats.shape[0] - 1):
+            out[i] = haversine(lats[i], lons[i], lats[i + 1], lons[i + 1])
+        return out
+
+    return _Kernels(haversine, bearing, haversine_many)
+
+
+@lru_cache(maxsize=1024)
+def _haversine_cached(coord1, coord2):
+    """
+    Aplica la fórmula del haversine a dos puntos. Ver `FlightPlan.haversine_distance`.
+    """
+    return _kernels().haversine(coord1[0], coord1[1], coord2[0], coord2[1])
+
+
+@lru_cache(maxsize=256)
+def _route_geometry(route_bytes):
+    """
+    Calcula la distancia total (km) y el rumbo inicial (grados) de una ruta.
+
+    Se memoriza por ruta, de modo que los planes repetidos con los mismos puntos no vuelven
+    a calcular la geometría.
+
+    Args:
+        route_bytes (bytes): Bytes de un array float64 de forma (N, 2) con las coordenadas
+            (lat, lon) en orden de vuelo, tal como los devuelve `ndarray.tobytes()`.
+
+    Returns:
+        tuple: (distancia total en km, rumbo inicial en grados).
+    """
+    coords = np.frombuffer(route_bytes, dtype=np.float64).reshape(-1, 2)
+    distance = float(FlightPlan.haversine_array(coords).sum())
+    (lat1, lon1), (lat2, lon2) = coords[0].tolist(), coords[-1].tolist()
+    bearing = _kernels().bearing(lat1, lon1, lat2, lon2)
+    return distance, bearing
+
 
 class FlightPlan:
     """
@@ -18,33 +158,64 @@ class FlightPlan:
     teniendo en cuenta las condiciones meteorológicas actuales.
 
     Atributos:
-        departure (tuple): Coordenadas (lat, lon) del punto de partida.
-        arrival (tuple): Coordenadas (lat, lon) del punto de llegada.
-        waypoints (list): Lista de tuplas de coordenadas para puntos intermedios.
+        departure (Coordinate): Coordenadas (lat, lon) del punto de partida.
+        arrival (Coordinate): Coordenadas (lat, lon) del punto de llegada.
+        waypoints (list): Lista de coordenadas (Coordinate) para puntos intermedios.
         weather_conditions (dict): Condiciones meteorológicas almacenadas en caché para coordenadas.
         total_distance (float): Distancia total de la ruta de vuelo en km.
         adjusted_speed (float): Velocidad ajustada considerando las condiciones meteorológicas.
+        flight_direction (float): Rumbo inicial en grados, calculado en el primer acceso.
         weather_api (WeatherAPI): Instancia de WeatherAPI para obtener datos meteorológicos.
     """
 
-    def __init__(self, departure, arrival, waypoints=[]):
+    def __init__(self, departure, arrival, waypoints=()):
         """
         Inicializa una instancia de FlightPlan.
 
         Args:
             departure (tuple): Coordenadas (lat, lon) del punto de partida.
             arrival (tuple): Coordenadas (lat, lon) del punto de llegada.
-            waypoints (list, opcional): Lista de tuplas de coordenadas para puntos intermedios.
+            waypoints (iterable, opcional): Tuplas de coordenadas para puntos intermedios.
+                Por defecto no hay puntos intermedios.
             api_key (str, opcional): Clave API para datos meteorológicos. Por defecto es None.
         """
-        self.departure = self._validate_coordinates(departure)
-        self.arrival = self._validate_coordinates(arrival)
-        self.waypoints = [self._validate_coordinates(wp) for wp in waypoints]
+        waypoints = list(waypoints)
+        self._validate_batch([departure, arrival, *waypoints])
+        # Points are kept as Coordinates for attribute access and as an (N, 2) float64
+        # array (one row per point) for the vectorized route math.
+        self._points = tuple(
+            Coordinate(*point) for point in (departure, *waypoints, arrival)
+        )
+        self._route = np.array(self._points, dtype=np.float64)
         self.weather_conditions = {}
         self.total_distance = 0
         self.adjusted_speed = 0
         self.weather_api = WeatherAPI()
 
+    @property
+    def departure(self):
+        """
+        Coordinate: Coordenadas del punto de partida.
+        """
+        return self._points[0]
+
+    @property
+    def arrival(self):
+        """
+        Coordinate: Coordenadas del punto de llegada.
+        """
+        return self._points[-1]
+
+    @property
+    def waypoints(self):
+        """
+        list: Copia de las coordenadas de los puntos intermedios, en orden.
+
+        Los puntos de la ruta son de solo lectura: modificar la lista devuelta no cambia el
+        plan; para cambiar la ruta se crea un nuevo plan.
+        """
+        return list(self._points[1:-1])
+
     def __repr__(self):
         """
         Devuelve una representación en cadena del objeto FlightPlan.
@@ -54,7 +225,8 @@ class FlightPlan:
         Returns:
             str: Una cadena que representa el objeto FlightPlan.
         """
-        return f"FlightPlan(departure={self.departure}, arrival={self.arrival}, waypoints={self.waypoints})"
+        departure, *waypoints, arrival = map(tuple, self._points)
+        return f"FlightPlan(departure={departure}, arrival={arrival}, waypoints={waypoints})"
 
     def _validate_coordinates(self, coord):
         """
@@ -76,7 +248,7 @@ class FlightPlan:
             raise ValueError(
                 f"Coordinates must be float type. Given coordinate: {coord}"
             )
-        if len(str(lat).split(".")[1]) != 4 or len(str(lon).split(".")[1]) != 4:
+        if not (_has_four_decimals(lat) and _has_four_decimals(lon)):
             raise ValueError(
                 f"Coordinates must have 4 decimal places. Given coordinate: {coord}"
             )
@@ -90,6 +262,41 @@ class FlightPlan:
             )
         return coord
 
+    def _validate_batch(self, coords):
+        """
+        Valida de una vez todas las coordenadas de un plan de vuelo.
+
+        Para rutas largas aplica las reglas de `_validate_coordinates` sobre un único array de
+        NumPy. Para rutas cortas, o si alguna coordenada no supera la comprobación vectorizada,
+        valida punto a punto con `_validate_coordinates`, de modo que los errores son los mismos.
+
+        Args:
+            coords (list): Lista de tuplas (lat, lon) a validar.
+
+        Returns:
+            list: Las coordenadas validadas.
+
+        Raises:
+            ValueError: Si alguna coordenada no cumple con los criterios de validación.
+        """
+        if len(coords) >= _BATCH_VALIDATION_MIN_POINTS:
+            try:
+                array = np.asarray(coords)
+            except ValueError:
+                array = None
+            if (
+                array is not None
+                and array.dtype == np.float64
+                and array.ndim == 2
+                and array.shape[1] == 2
+                and (np.abs(array[:, 0]) <= 90).all()
+                and (np.abs(array[:, 1]) <= 180).all()
+                and (np.round(array, 4) == array).all()
+                and (np.round(array, 3) != array).all()
+            ):
+                return coords
+        return [self._validate_coordinates(coord) for coord in coords]
+
     @contextmanager
     def weather_api_context(self):
         """
@@ -107,7 +314,7 @@ class FlightPlan:
             try:
                 yield self.weather_api
             except Exception as e:
-                print(f"Error accessing weather API: {e}")
+                _LOG.warning("Error accessing weather API: %s", e)
                 yield None
 
     def get_weather_at_point(self, coordinates):
@@ -123,22 +330,43 @@ class FlightPlan:
         Returns:
             Weather: Una instancia de la clase Weather con las condiciones actuales.
         """
-        if coordinates not in self.weather_conditions:
+        weather = self.weather_conditions.get(coordinates)
+        if weather is None:
             with self.weather_api_context() as api:
                 if api:
                     try:
-                        weather_data = api.get_weather(*coordinates)
-                        self.weather_conditions[coordinates] = Weather(**weather_data)
+                        weather = Weather.from_api(api, *coordinates)
+                        if weather is None:
+                            _LOG.warning("No weather data returned for %s", coordinates)
                     except Exception as e:
-                        print(f"Error obtaining weather data for {coordinates}: {e}")
-                        self.weather_conditions[coordinates] = (
-                            self._generate_random_weather()
+                        _LOG.warning(
+                            "Error obtaining weather data for %s: %s", coordinates, e
                         )
-                else:
-                    self.weather_conditions[coordinates] = (
-                        self._generate_random_weather()
-                    )
-        return self.weather_conditions[coordinates]
+                if weather is None:
+                    weather = self._generate_random_weather()
+            self.weather_conditions[coordinates] = weather
+        return weather
+
+    def _prefetch_weather(self, points):
+        """
+        Obtiene en paralelo las condiciones meteorológicas de los puntos que aún no están en caché.
+
+        Cada consulta a la API está limitada por la latencia de red, por lo que lanzarlas a la vez
+        reduce el tiempo de espera total al de la consulta más lenta. Los resultados quedan en
+        `weather_conditions`, de modo que las llamadas posteriores a `get_weather_at_point` no
+        vuelven a acceder a la red. Sin API no hay nada que esperar y no se lanzan hilos.
+
+        Args:
+            points (iterable): Coordenadas (lat, lon) de los puntos a consultar.
+        """
+        if self.weather_api is None:
+            return
+        pending = [p for p in dict.fromkeys(points) if p not in self.weather_conditions]
+        if len(pending) < 2:
+            return
+        workers = min(_PREFETCH_MAX_WORKERS, len(pending))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(self.get_weather_at_point, pending))
 
     def _generate_random_weather(self):
         """
@@ -149,14 +377,7 @@ class FlightPlan:
         Returns:
             Weather: Una instancia de Weather con datos meteorológicos generados aleatoriamente.
         """
-        return Weather(
-            wind_speed=random.uniform(0, 100),
-            wind_direction=random.uniform(0, 360),
-            temperature=random.uniform(-10, 40),
-            humidity=random.uniform(0, 100),
-            pressure=random.uniform(950, 1050),
-            description=random.choice(["Clear", "Cloudy", "Rainy", "Snowy", "Windy"]),
-        )
+        return Weather.generate_random()
 
     def calculate_route(self):
         """
@@ -164,28 +385,26 @@ class FlightPlan:
 
         Este método calcula la distancia total de la ruta de vuelo, incluyendo
         los puntos intermedios, y obtiene datos meteorológicos para los puntos de partida y llegada.
+        Las condiciones obtenidas se registran en el logger del módulo a nivel DEBUG.
 
         Returns:
             float: La distancia total de la ruta en kilómetros.
         """
-        total_distance = 0
-        route = [self.departure] + self.waypoints + [self.arrival]
-
-        for i in range(len(route) - 1):
-            distance = self.haversine_distance(route[i], route[i + 1])
-            total_distance += distance
+        total_distance, _ = _route_geometry(self._route_key())
 
         self.total_distance = total_distance
 
-        # Get and display weather for departure and arrival
+        # Get and log weather for departure and arrival
+        self._prefetch_weather((self.departure, self.arrival))
         departure_weather = self.get_weather_at_point(self.departure)
         arrival_weather = self.get_weather_at_point(self.arrival)
 
-        print("\nWeather conditions:\n")
-        print(f"Departure ({self._get_point_name(self.departure)}):")
-        print(departure_weather)
-        print(f"\nArrival ({self._get_point_name(self.arrival)}):")
-        print(arrival_weather)
+        _LOG.debug(
+            "Departure (%s):\n%s", self._get_point_name(self.departure), departure_weather
+        )
+        _LOG.debug(
+            "Arrival (%s):\n%s", self._get_point_name(self.arrival), arrival_weather
+        )
 
         return total_distance
 
@@ -199,20 +418,16 @@ class FlightPlan:
         Returns:
             str: El nombre del punto si está en la lista predefinida, o una representación de las coordenadas.
         """
-        point_names = {
-            (40.4168, -3.7038): "Madrid",
-            (41.6528, -4.7245): "Valladolid",
-            (40.9429, -4.1088): "Segovia",
-        }
-        return point_names.get(coordinates, f"Point {coordinates}")
+        return _POINT_NAMES.get(coordinates) or f"Point {tuple(coordinates)}"
 
     @staticmethod
-    @lru_cache(maxsize=None)
     def haversine_distance(coord1, coord2):
         """
         Calcula la distancia del círculo máximo entre dos puntos en la Tierra usando la fórmula del haversine.
 
-        Este método está decorado con @lru_cache para mejorar el rendimiento en cálculos repetidos.
+        Los resultados se memorizan en una caché LRU acotada para mejorar el rendimiento en
+        cálculos repetidos sin que crezca indefinidamente. Si ambos puntos son iguales se
+        devuelve 0 sin consultar la caché.
 
         Args:
             coord1 (tuple): Coordenadas (latitud, longitud) del primer punto.
@@ -221,47 +436,80 @@ class FlightPlan:
         Returns:
             float: La distancia entre los dos puntos en kilómetros.
         """
-        R = 6371  # Earth's radius in kilometers
+        if coord1 == coord2:
+            return 0.0
+        return _haversine_cached(coord1, coord2)
+
+    @staticmethod
+    def haversine_array(coords):
+        """
+        Calcula las distancias de todos los tramos consecutivos de una ruta en una sola pasada.
+
+        Versión vectorizada de `haversine_distance`: en lugar de evaluar cada tramo en un bucle
+        de Python, aplica la fórmula del haversine sobre arrays de NumPy. Si Numba está
+        instalado se usa en su lugar un kernel compilado que reparte los tramos entre hilos.
+
+        Args:
+            coords (numpy.ndarray): Array de forma (N, 2) con las coordenadas (latitud, longitud)
+                de los puntos de la ruta, en orden.
+
+        Returns:
+            numpy.ndarray: Array de N - 1 distancias en kilómetros, una por tramo.
+        """
+        haversine_many = _kernels().haversine_many
+        if haversine_many is not None:
+            return haversine_many(
+                np.ascontiguousarray(coords[:, 0]), np.ascontiguousarray(coords[:, 1])
+            )
 
-        lat1, lon1 = math.radians(coord1[0]), math.radians(coord1[1])
-        lat2, lon2 = math.radians(coord2[0]), math.radians(coord2[1])
+        lat = np.radians(coords[:, 0])
+        lon = np.radians(coords[:, 1])
 
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
+        dlat = np.diff(lat)
+        dlon = np.diff(lon)
 
         a = (
-            math.sin(dlat / 2) ** 2
-            + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
+            np.sin(dlat / 2) ** 2
+            + np.cos(lat[:-1]) * np.cos(lat[1:]) * np.sin(dlon / 2) ** 2
         )
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+        np.clip(a, 0.0, 1.0, out=a)
 
-        return R * c
+        return 2 * _EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
 
-    def calculate_flight_direction(self):
+    def _route_key(self):
         """
-        Calcula la dirección inicial del vuelo desde el punto de partida hasta el punto de llegada.
+        Devuelve una clave hashable que identifica la ruta completa.
+
+        Returns:
+            bytes: Los bytes del array de coordenadas de la ruta.
+        """
+        return self._route.tobytes()
+
+    @cached_property
+    def flight_direction(self):
+        """
+        Dirección inicial del vuelo desde el punto de partida hasta el punto de llegada.
 
         Utiliza la fórmula del rumbo inicial para determinar la dirección del vuelo en grados.
+        Solo depende de los puntos de partida y llegada, por lo que se calcula en el primer
+        acceso y se reutiliza en los siguientes.
 
         Returns:
             float: La dirección del vuelo en grados (0-360).
         """
-        lat1, lon1 = math.radians(self.departure[0]), math.radians(self.departure[1])
-        lat2, lon2 = math.radians(self.arrival[0]), math.radians(self.arrival[1])
-
-        dlon = lon2 - lon1
-
-        y = math.sin(dlon) * math.cos(lat2)
-        x = math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * math.cos(
-            lat2
-        ) * math.cos(dlon)
+        _, bearing = _route_geometry(self._route_key())
+        return bearing
 
-        initial_bearing = math.atan2(y, x)
+    def calculate_flight_direction(self):
+        """
+        Calcula la dirección inicial del vuelo desde el punto de partida hasta el punto de llegada.
 
-        initial_bearing = math.degrees(initial_bearing)
-        compass_bearing = (initial_bearing + 360) % 360
+        Se mantiene por compatibilidad; equivale a leer `flight_direction`.
 
-        return compass_bearing
+        Returns:
+            float: La dirección del vuelo en grados (0-360).
+        """
+        return self.flight_direction
 
     def estimate_time(self, cruise_speed):
         """
@@ -284,22 +532,15 @@ class FlightPlan:
             raise ValueError("Speed must be greater than 0.")
 
         weather_at_departure = self.get_weather_at_point(self.departure)
-        flight_direction = self.calculate_flight_direction()
+        flight_direction = self.flight_direction
 
         wind_impact = weather_at_departure.impact_on_speed(flight_direction)
         adjusted_cruise_speed = max(100, cruise_speed + wind_impact)
 
-        taxi_time = 10 / 60  # 10 minutes in hours
-        climb_time = 15 / 60  # 15 minutes in hours
-        descent_time = 15 / 60  # 15 minutes in hours
-
-        climb_descent_distance = (climb_time + descent_time) * (
-            adjusted_cruise_speed / 2
-        )
+        climb_descent_distance = _CLIMB_DESCENT_HALF_H * adjusted_cruise_speed
         cruise_distance = max(0, self.total_distance - climb_descent_distance)
-        cruise_time = cruise_distance / adjusted_cruise_speed
 
-        total_time = taxi_time + climb_time + cruise_time + descent_time
+        total_time = _FIXED_OVERHEAD_H + cruise_distance / adjusted_cruise_speed
 
         self.adjusted_speed = self.total_distance / total_time  # Actual average speed
 
@@ -326,6 +567,12 @@ if __name__ == "__main__":
         total_distance = flight_plan.calculate_route()
         estimated_time = flight_plan.estimate_time(800)
 
+        print("\nWeather conditions:\n")
+        print(f"Departure ({flight_plan._get_point_name(madrid)}):")
+        print(flight_plan.get_weather_at_point(madrid))
+        print(f"\nArrival ({flight_plan._get_point_name(valladolid)}):")
+        print(flight_plan.get_weather_at_point(valladolid))
+
         print(f"\nTotal distance: {total_distance:.2f} km")
         print(f"Average speed: {flight_plan.adjusted_speed:.2f} km/h")
         print(
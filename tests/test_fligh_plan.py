@@ -8,10 +8,13 @@ meteorológicos, cálculo de rutas y estimación de tiempos de vuelo.
 """
 
 import set_pythonpath
+import json
 import unittest
+import numpy as np
 from unittest.mock import patch, MagicMock
 from flight_plan import FlightPlan, Coordinate
 from weather import Weather
+from weather_api import WeatherAPI
 
 
 class TestFlightPlan(unittest.TestCase):
@@ -60,6 +63,20 @@ class TestFlightPlan(unittest.TestCase):
         with self.assertRaises(ValueError):
             fp._validate_coordinates(invalid_coord)
 
+    def test_validate_batch(self):
+        """
+        Prueba la validación conjunta de rutas largas.
+
+        Verifica que una ruta con muchos puntos intermedios válidos se acepte
+        y que un único punto inválido entre ellos lance una excepción ValueError.
+        """
+        waypoints = [(round(40.1001 + i / 1000, 4), -4.0001) for i in range(50)]
+        fp = FlightPlan(self.departure, self.arrival, waypoints)
+        self.assertEqual(fp.waypoints, waypoints)
+
+        with self.assertRaises(ValueError):
+            FlightPlan(self.departure, self.arrival, waypoints + [(40.41, -4.0001)])
+
     @patch("flight_plan.WeatherAPI")
     def test_get_weather_at_point(self, mock_weather_api):
         """
@@ -70,14 +87,14 @@ class TestFlightPlan(unittest.TestCase):
         """
         mock_api_instance = MagicMock()
         mock_weather_api.return_value = mock_api_instance
-        mock_api_instance.get_weather.return_value = {
-            "wind_speed": 10,
-            "wind_direction": 180,
-            "temperature": 20,
-            "humidity": 50,
-            "pressure": 1013,
-            "description": "Cloudy",
-        }
+        mock_api_instance.get_weather_tuple.return_value = (
+            10,
+            180,
+            20,
+            50,
+            1013,
+            "Cloudy",
+        )
 
         fp = FlightPlan(self.departure, self.arrival, api_key="test_key")
         weather = fp.get_weather_at_point(self.departure)
@@ -86,6 +103,37 @@ class TestFlightPlan(unittest.TestCase):
         self.assertEqual(weather.wind_speed, 10)
         self.assertEqual(weather.description, "Cloudy")
 
+    def test_weather_cache_shared_between_plans(self):
+        """
+        Prueba que la caché de la API del clima se comparta entre planes.
+
+        Verifica que dos planes de vuelo que consultan el mismo punto
+        realicen una única solicitud a la API.
+        """
+        response = MagicMock(status_code=200)
+        response.content = json.dumps(
+            {
+                "wind": {"speed": 10, "deg": 180},
+                "main": {"temp": 20, "humidity": 50, "pressure": 1013},
+                "weather": [{"description": "Cloudy"}],
+            }
+        ).encode()
+        WeatherAPI._cache.clear()
+        self.addCleanup(WeatherAPI._cache.clear)
+
+        with patch("weather_api.API_KEY", "test_key"), patch.object(
+            WeatherAPI, "_session"
+        ) as session:
+            session.get.return_value = response
+            first = FlightPlan(self.departure, self.arrival)
+            second = FlightPlan(self.departure, self.waypoint)
+            first_weather = first.get_weather_at_point(first.departure)
+            second_weather = second.get_weather_at_point(second.departure)
+
+        self.assertEqual(session.get.call_count, 1)
+        self.assertEqual(first_weather.wind_speed, 10)
+        self.assertEqual(second_weather.wind_speed, 10)
+
     def test_calculate_route(self):
         """
         Prueba el cálculo de la ruta de vuelo.
@@ -100,6 +148,57 @@ class TestFlightPlan(unittest.TestCase):
         # and compare it with a small tolerance
         self.assertGreater(total_distance, 0)
 
+    @patch("flight_plan.WeatherAPI")
+    def test_calculate_route_prefetches_weather(self, mock_weather_api):
+        """
+        Prueba la obtención de datos meteorológicos en calculate_route.
+
+        Verifica que una sola llamada deje en caché las condiciones de los
+        puntos de partida y llegada, con una consulta a la API por punto, y
+        que sin API no se lancen hilos.
+        """
+        mock_api_instance = MagicMock()
+        mock_weather_api.return_value = mock_api_instance
+        mock_api_instance.get_weather_tuple.return_value = (
+            10,
+            180,
+            20,
+            50,
+            1013,
+            "Cloudy",
+        )
+
+        fp = FlightPlan(self.departure, self.arrival, [self.waypoint])
+        fp.calculate_route()
+
+        self.assertEqual(set(fp.weather_conditions), {self.departure, self.arrival})
+        for weather in fp.weather_conditions.values():
+            self.assertEqual(weather.wind_speed, 10)
+        self.assertEqual(mock_api_instance.get_weather_tuple.call_count, 2)
+
+        fp = FlightPlan(self.departure, self.arrival)
+        fp.weather_api = None
+        with patch("flight_plan.ThreadPoolExecutor") as mock_executor:
+            fp.calculate_route()
+        mock_executor.assert_not_called()
+        self.assertEqual(len(fp.weather_conditions), 2)
+
+    def test_haversine_array(self):
+        """
+        Prueba el cálculo vectorizado de distancias por tramo.
+
+        Verifica que haversine_array devuelva una distancia por tramo y que
+        coincida con el cálculo escalar de haversine_distance.
+        """
+        route = [self.departure, self.waypoint, self.arrival]
+        distances = FlightPlan.haversine_array(np.array(route))
+
+        self.assertEqual(len(distances), 2)
+        for distance, (start, end) in zip(distances, zip(route, route[1:])):
+            self.assertAlmostEqual(
+                distance, FlightPlan.haversine_distance(start, end), places=6
+            )
+
     def test_estimate_time(self):
         """
         Prueba la estimación del tiempo de vuelo.
@@ -0,0 +1,92 @@
+"""
+Módulo de pruebas unitarias para las clases Weather y WeatherArray.
+
+Este módulo contiene pruebas unitarias para verificar el cálculo del impacto
+del viento en la velocidad de vuelo, tanto para una sola muestra como para
+conjuntos de muestras almacenados por columnas.
+"""
+
+import set_pythonpath
+import unittest
+import numpy as np
+from weather import Weather, WeatherArray
+
+
+class TestWeather(unittest.TestCase):
+    """
+    Conjunto de pruebas para las clases Weather y WeatherArray.
+    """
+
+    def setUp(self):
+        """
+        Configura el entorno de prueba antes de cada método de prueba.
+
+        Crea dos muestras meteorológicas y los rumbos que se evaluarán.
+        """
+        self.weathers = [
+            Weather(10, 30, 20, 50, 1013, "Clear"),
+            Weather(25, 200, 15, 80, 1002, "Rainy"),
+        ]
+        self.directions = [0, 90, 300]
+
+    def test_impact_on_speed_batch(self):
+        """
+        Prueba el cálculo vectorizado del impacto del viento.
+
+        Verifica que impact_on_speed_batch coincida con impact_on_speed
+        para cada dirección de vuelo.
+        """
+        weather = self.weathers[0]
+        impacts = weather.impact_on_speed_batch(self.directions)
+
+        for impact, direction in zip(impacts, self.directions):
+            self.assertAlmostEqual(impact, weather.impact_on_speed(direction))
+
+    def test_impact_on_speed_after_wind_change(self):
+        """
+        Prueba el impacto del viento tras modificar su dirección.
+
+        Verifica que impact_on_speed e impact_on_speed_batch usen la nueva
+        dirección del viento.
+        """
+        weather = Weather(10, 0, 20, 50, 1013, "Clear")
+        weather.wind_direction = 180
+
+        self.assertAlmostEqual(weather.impact_on_speed(0), -10)
+        self.assertAlmostEqual(weather.impact_on_speed_batch([0])[0], -10)
+
+    def test_weather_array_from_list(self):
+        """
+        Prueba la conversión de una lista de Weather a WeatherArray.
+
+        Verifica que se conserven los valores y las descripciones, y que el
+        impacto del viento coincida con el de cada muestra.
+        """
+        weather_array = WeatherArray.from_list(self.weathers)
+
+        self.assertEqual(len(weather_array), 2)
+        self.assertEqual(list(weather_array.description), ["Clear", "Rainy"])
+        self.assertEqual(list(weather_array.description_code), [0, 2])
+        impacts = weather_array.impact_on_speed(45)
+        for impact, weather in zip(impacts, self.weathers):
+            self.assertAlmostEqual(impact, weather.impact_on_speed(45), places=4)
+
+    def test_generate_random_batch(self):
+        """
+        Prueba la generación de muestras aleatorias por lotes.
+
+        Verifica el número de muestras y que los valores queden dentro de
+        los mismos rangos que generate_random.
+        """
+        weather_array = Weather.generate_random_batch(1000)
+
+        self.assertEqual(len(weather_array), 1000)
+        wind_direction = weather_array.wind_direction
+        pressure = weather_array.pressure
+        self.assertTrue(np.all((0 <= wind_direction) & (wind_direction <= 360)))
+        self.assertTrue(np.all((950 <= pressure) & (pressure <= 1050)))
+        self.assertLess(weather_array.description_code.max(), len(weather_array.labels))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+"""
+Módulo de pruebas unitarias para la clase WeatherAPI.
+
+Este módulo contiene pruebas unitarias para verificar la obtención de datos
+meteorológicos sin acceder a la red, simulando las respuestas de la API.
+"""
+
+import set_pythonpath
+import json
+import unittest
+import numpy as np
+import requests
+from unittest.mock import patch, MagicMock
+from weather import DESCRIPTIONS, Weather, WeatherArray
+from weather_api import WeatherAPI
+
+
+class TestWeatherAPI(unittest.TestCase):
+    """
+    Conjunto de pruebas para la clase WeatherAPI.
+    """
+
+    def setUp(self):
+        """
+        Configura el entorno de prueba antes de cada método de prueba.
+
+        Crea una instancia de WeatherAPI con una clave de prueba, vacía la
+        caché compartida y sustituye su sesión HTTP por un mock que devuelve
+        una respuesta válida.
+        """
+        WeatherAPI._cache.clear()
+        self.addCleanup(WeatherAPI._cache.clear)
+        with patch("weather_api.API_KEY", "test_key"):
+            self.api = WeatherAPI()
+
+        self.response = MagicMock(status_code=200)
+        self.response.content = json.dumps(
+            {
+                "wind": {"speed": 10, "deg": 180},
+                "main": {"temp": 20, "humidity": 50, "pressure": 1013},
+                "weather": [{"description": "Cloudy"}],
+            }
+        ).encode()
+        self.api._session = MagicMock()
+        self.api._session.get.return_value = self.response
+
+    def test_get_weather_cached(self):
+        """
+        Prueba la caché de datos meteorológicos.
+
+        Verifica que dos puntos a menos de ~1 km compartan una única
+        solicitud a la API y devuelvan los mismos datos.
+        """
+        first = self.api.get_weather(40.4168, -3.7038)
+        second = self.api.get_weather(40.4201, -3.7012)
+
+        self.assertEqual(first, second)
+        self.assertEqual(first["wind_speed"], 10)
+        self.assertEqual(first["description"], "Cloudy")
+        self.assertEqual(self.api._session.get.call_count, 1)
+
+    def test_get_weather_many(self):
+        """
+        Prueba la obtención concurrente de datos meteorológicos.
+
+        Verifica que se devuelva un resultado por punto, en orden, y que los
+        puntos de la misma celda de la caché generen una sola solicitud.
+        """
+        coordinates = [(40.4168, -3.7038), (41.6528, -4.7245), (40.4201, -3.7012)]
+        results = self.api.get_weather_many(coordinates)
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0]["temperature"], 20)
+        self.assertEqual(self.api._session.get.call_count, 2)
+
+    def test_weather_array_from_api(self):
+        """
+        Prueba la creación de un WeatherArray con datos de la API.
+
+        Verifica que las columnas sean float32, que los resultados respeten
+        el orden de entrada aunque dos puntos compartan celda de la caché, y
+        que una descripción libre de la API reciba un código posterior a
+        DESCRIPTIONS y se pueda recuperar como texto.
+        """
+        descriptions = {40.42: "Rainy", 41.65: "scattered clouds"}
+
+        def respond(url, params, timeout):
+            response = MagicMock(status_code=200)
+            response.content = json.dumps(
+                {
+                    "wind": {"speed": params["lat"], "deg": 180},
+                    "main": {"temp": 20, "humidity": 50, "pressure": 1013},
+                    "weather": [{"description": descriptions[params["lat"]]}],
+                }
+            ).encode()
+            return response
+
+        self.api._session.get.side_effect = respond
+        coordinates = [(40.4168, -3.7038), (41.6528, -4.7245), (40.4201, -3.7012)]
+        weather_array = WeatherArray.from_api(self.api, coordinates)
+
+        for column in (
+            weather_array.wind_speed,
+            weather_array.wind_direction,
+            weather_array.temperature,
+            weather_array.humidity,
+            weather_array.pressure,
+        ):
+            self.assertEqual(column.dtype, np.float32)
+        np.testing.assert_allclose(weather_array.wind_speed, [40.42, 41.65, 40.42])
+        rainy = DESCRIPTIONS.index("Rainy")
+        self.assertEqual(
+            list(weather_array.description_code), [rainy, len(DESCRIPTIONS), rainy]
+        )
+        self.assertEqual(
+            list(weather_array.description), ["Rainy", "scattered clouds", "Rainy"]
+        )
+        self.assertEqual(self.api._session.get.call_count, 2)
+
+    def test_get_weather_tuple(self):
+        """
+        Prueba la obtención de datos meteorológicos como tupla.
+
+        Verifica que get_weather_tuple devuelva los valores en el orden del
+        constructor de Weather y que Weather.from_api los use; ante un error
+        de la API ambos deben devolver None.
+        """
+        self.assertEqual(
+            self.api.get_weather_tuple(40.4168, -3.7038),
+            (10, 180, 20, 50, 1013, "Cloudy"),
+        )
+        weather = Weather.from_api(self.api, 40.4168, -3.7038)
+        self.assertIsInstance(weather, Weather)
+        self.assertEqual(weather.wind_direction, 180)
+        self.assertEqual(weather.description, "Cloudy")
+
+        self.response.status_code = 401
+        self.assertIsNone(self.api.get_weather_tuple(41.6528, -4.7245))
+        self.assertIsNone(Weather.from_api(self.api, 41.6528, -4.7245))
+
+    def test_get_weather_error(self):
+        """
+        Prueba el manejo de respuestas con error de la API.
+
+        Verifica que get_weather devuelva None sin guardar el error en caché,
+        que get_weather_or_raise lance una excepción y que check_api_status
+        devuelva False, también para respuestas distintas de 200 sin error.
+        """
+        self.response.status_code = 401
+        self.response.raise_for_status.side_effect = requests.HTTPError("401")
+
+        self.assertIsNone(self.api.get_weather(40.4168, -3.7038))
+        with self.assertRaises(requests.HTTPError):
+            self.api.get_weather_or_raise(40.4168, -3.7038)
+        self.assertFalse(self.api.check_api_status())
+        self.assertEqual(self.api._session.get.call_count, 3)
+
+        self.response.status_code = 204
+        self.response.raise_for_status.side_effect = None
+
+        self.assertIsNone(self.api.get_weather(40.4168, -3.7038))
+        with self.assertRaises(requests.HTTPError):
+            self.api.get_weather_or_raise(40.4168, -3.7038)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,71 @@
 import math
 import random
+import numpy as np
+from functools import lru_cache
+
+_DEG2RAD = math.pi / 180.0
+_DEG2RAD_F32 = np.float32(_DEG2RAD)
+
+# Base description labels; WeatherArray gives them the same codes in every instance
+DESCRIPTIONS = ("Clear", "Cloudy", "Rainy", "Snowy", "Windy")
+_rand = random.Random()
+_rng = np.random.default_rng()
+
+_NUMERIC_FIELDS = ("wind_speed", "wind_direction", "temperature", "humidity", "pressure")
+
+
+def _impact_batch(wind_speed, wind_dir_rad, dirs_rad, out):
+    """
+    Componente del viento para cada dirección de `dirs_rad` (en radianes), escrita en `out`.
+    """
+    for i in range(dirs_rad.shape[0]):
+        out[i] = wind_speed * math.cos(wind_dir_rad - dirs_rad[i])
+
+
+try:
+    # Compiled kernel, available after `cythonize -i weather_fast.pyx`
+    from weather_fast import impact_on_speed as _impact_on_speed
+except ImportError:
+
+    def _impact_on_speed(wind_speed, wind_dir_rad, flight_direction):
+        """
+        Componente del viento sobre la dirección de vuelo `flight_direction` (en grados).
+        """
+        return wind_speed * math.cos(wind_dir_rad - flight_direction * _DEG2RAD)
+
+
+def _encode_descriptions(descriptions):
+    """
+    Codifica descripciones textuales como índices en una tabla de etiquetas.
+
+    La tabla empieza por `DESCRIPTIONS`, de modo que las descripciones conocidas tienen el
+    mismo código en cualquier WeatherArray; las demás se añaden al final en orden de aparición.
+
+    Args:
+        descriptions (iterable): Descripciones textuales.
+
+    Returns:
+        tuple: La lista de códigos y la tupla de etiquetas correspondiente.
+    """
+    codes = {label: code for code, label in enumerate(DESCRIPTIONS)}
+    description_code = [codes.setdefault(label, len(codes)) for label in descriptions]
+    return description_code, tuple(codes)
+
+
+@lru_cache(maxsize=1)
+def _impact_kernel():
+    """
+    Devuelve `_impact_batch` compilado con Numba, o None si Numba no está instalado.
+
+    Numba se importa la primera vez que se necesita el kernel, no al cargar el módulo, para
+    no añadir su tiempo de importación a quien solo usa los cálculos escalares.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    # nogil lets callers score several routes from worker threads in parallel
+    return njit(cache=True, fastmath=True, nogil=True)(_impact_batch)
 
 
 class Weather:
@@ -18,6 +84,16 @@ class Weather:
         description (str): Descripción textual del clima.
     """
 
+    __slots__ = (
+        "wind_speed",
+        "_wind_direction",
+        "temperature",
+        "humidity",
+        "pressure",
+        "description",
+        "_wind_dir_rad",
+    )
+
     def __init__(
         self, wind_speed, wind_direction, temperature, humidity, pressure, description
     ):
@@ -40,6 +116,19 @@ class Weather:
         self.pressure = pressure
         self.description = description
 
+    @property
+    def wind_direction(self):
+        """
+        float: Dirección del viento en grados.
+        """
+        return self._wind_direction
+
+    @wind_direction.setter
+    def wind_direction(self, value):
+        self._wind_direction = value
+        # Cached for impact_on_speed, which is evaluated repeatedly against one Weather
+        self._wind_dir_rad = value * _DEG2RAD
+
     def __str__(self):
         return (
             f"Wind Speed: {self.wind_speed:.2f} km/h\n"
@@ -60,11 +149,33 @@ class Weather:
         Returns:
             float: El impacto en la velocidad en km/h (positivo para viento a favor, negativo para viento en contra).
         """
-        wind_dir_rad = math.radians(self.wind_direction)
-        flight_dir_rad = math.radians(flight_direction)
-        angle_diff = abs(wind_dir_rad - flight_dir_rad)
-        wind_component = self.wind_speed * math.cos(angle_diff)
-        return wind_component
+        return _impact_on_speed(self.wind_speed, self._wind_dir_rad, flight_direction)
+
+    def impact_on_speed_batch(self, flight_directions):
+        """
+        Calcula el impacto del viento en la velocidad para varias direcciones de vuelo a la vez.
+
+        Versión vectorizada de `impact_on_speed`, útil para evaluar muchos tramos o rumbos
+        candidatos con las mismas condiciones meteorológicas. Si Numba está instalado se usa
+        un kernel compilado; si no, operaciones vectorizadas de NumPy.
+
+        Args:
+            flight_directions (array-like): Direcciones de vuelo en grados.
+
+        Returns:
+            numpy.ndarray: El impacto en la velocidad en km/h para cada dirección.
+        """
+        flight_directions = np.asarray(flight_directions, dtype=np.float64)
+        kernel = _impact_kernel()
+        if kernel is None:
+            return self.wind_speed * np.cos(
+                np.deg2rad(self.wind_direction - flight_directions)
+            )
+
+        dirs_rad = np.deg2rad(flight_directions).ravel()
+        out = np.empty_like(dirs_rad)
+        kernel(self.wind_speed, self._wind_dir_rad, dirs_rad, out)
+        return out.reshape(flight_directions.shape)
 
     @classmethod
     def from_api(cls, api, lat, lon):
@@ -77,18 +188,14 @@ class Weather:
             lon (float): Longitud del punto.
 
         Returns:
-            Weather: Una nueva instancia de Weather con datos de la API.
+            Weather: Una nueva instancia de Weather con datos de la API, o None si la API no
+                     devolvió datos.
         """
 
-        weather_data = api.get_weather(lat, lon)
-        return cls(
-            weather_data["wind_speed"],
-            weather_data["wind_direction"],
-            weather_data["temperature"],
-            weather_data["humidity"],
-            weather_data["pressure"],
-            weather_data["description"],
-        )
+        values = api.get_weather_tuple(lat, lon)
+        if values is None:
+            return None
+        return cls(*values)
 
     @classmethod
     def generate_random(cls):
@@ -98,11 +205,175 @@ class Weather:
         Returns:
             Weather: Una nueva instancia de Weather con datos aleatorios.
         """
+        rand = _rand.random
+        return cls(
+            wind_speed=100 * rand(),  # 0-100 km/h
+            wind_direction=360 * rand(),  # 0-360°
+            temperature=-10 + 50 * rand(),  # -10-40 °C
+            humidity=100 * rand(),  # 0-100 %
+            pressure=950 + 100 * rand(),  # 950-1050 hPa
+            description=DESCRIPTIONS[int(len(DESCRIPTIONS) * rand())],
+        )
+
+    @classmethod
+    def generate_random_batch(cls, n, rng=None):
+        """
+        Genera muchas muestras meteorológicas aleatorias de una vez.
+
+        Usa los mismos rangos que `generate_random`, pero obtiene todos los valores con el
+        generador de NumPy y los devuelve por columnas, lo que resulta mucho más rápido para
+        simulaciones con miles de muestras.
+
+        Args:
+            n (int): Número de muestras a generar.
+            rng (numpy.random.Generator, opcional): Generador a utilizar. Por defecto se usa
+                uno compartido por el módulo.
+
+        Returns:
+            WeatherArray: Las muestras generadas.
+        """
+        if rng is None:
+            rng = _rng
+
+        def uniform(low, high):
+            return low + (high - low) * rng.random(n, dtype=np.float32)
+
+        return WeatherArray(
+            wind_speed=uniform(0, 100),
+            wind_direction=uniform(0, 360),
+            temperature=uniform(-10, 40),
+            humidity=uniform(0, 100),
+            pressure=uniform(950, 1050),
+            description_code=rng.integers(0, len(DESCRIPTIONS), n, dtype=np.uint8),
+        )
+
+
+class WeatherArray:
+    """
+    Una colección de condiciones meteorológicas almacenada por columnas.
+
+    En lugar de una lista de objetos `Weather`, guarda cada campo en su propio array de NumPy
+    contiguo, de modo que las operaciones sobre muchas muestras (medias, máximos, impacto del
+    viento sobre un rumbo) se resuelven con una única operación vectorizada.
+
+    Atributos:
+        wind_speed (numpy.ndarray): Velocidades del viento en km/h (float32).
+        wind_direction (numpy.ndarray): Direcciones del viento en grados (float32).
+        temperature (numpy.ndarray): Temperaturas en grados Celsius (float32).
+        humidity (numpy.ndarray): Humedades relativas en porcentaje (float32).
+        pressure (numpy.ndarray): Presiones atmosféricas en hPa (float32).
+        description_code (numpy.ndarray): Índice (uint8) de la descripción de cada muestra en
+            `labels`. Las descripciones de `DESCRIPTIONS` conservan su posición en esa tupla,
+            por lo que se pueden filtrar directamente (p. ej. `description_code == 2` para "Rainy").
+        labels (tuple): Descripciones textuales, indexadas por `description_code`.
+    """
+
+    def __init__(
+        self,
+        wind_speed,
+        wind_direction,
+        temperature,
+        humidity,
+        pressure,
+        description_code,
+        labels=DESCRIPTIONS,
+    ):
+        """
+        Inicializa una instancia de WeatherArray.
+
+        Args:
+            wind_speed (array-like): Velocidades del viento en km/h.
+            wind_direction (array-like): Direcciones del viento en grados.
+            temperature (array-like): Temperaturas en grados Celsius.
+            humidity (array-like): Humedades relativas en porcentaje.
+            pressure (array-like): Presiones atmosféricas en hPa.
+            description_code (array-like): Índices de la descripción de cada muestra en `labels`.
+            labels (iterable, opcional): Descripciones textuales. Por defecto es `DESCRIPTIONS`.
+        """
+        self.wind_speed = np.asarray(wind_speed, dtype=np.float32)
+        self.wind_direction = np.asarray(wind_direction, dtype=np.float32)
+        self.temperature = np.asarray(temperature, dtype=np.float32)
+        self.humidity = np.asarray(humidity, dtype=np.float32)
+        self.pressure = np.asarray(pressure, dtype=np.float32)
+        self.description_code = np.asarray(description_code, dtype=np.uint8)
+        self.labels = tuple(labels)
+
+    def __len__(self):
+        return len(self.wind_speed)
+
+    @property
+    def description(self):
+        """
+        numpy.ndarray: Descripción textual de cada muestra.
+        """
+        return np.array(self.labels, dtype=object)[self.description_code]
+
+    @classmethod
+    def from_list(cls, weathers):
+        """
+        Crea una instancia de WeatherArray a partir de una lista de objetos Weather.
+
+        Args:
+            weathers (list): Lista de instancias de Weather.
+
+        Returns:
+            WeatherArray: Las mismas condiciones almacenadas por columnas.
+        """
+        description_code, labels = _encode_descriptions(
+            weather.description for weather in weathers
+        )
         return cls(
-            wind_speed=random.uniform(0, 100),
-            wind_direction=random.uniform(0, 360),
-            temperature=random.uniform(-10, 40),
-            humidity=random.uniform(0, 100),
-            pressure=random.uniform(950, 1050),
-            description=random.choice(["Clear", "Cloudy", "Rainy", "Snowy", "Windy"]),
+            [weather.wind_speed for weather in weathers],
+            [weather.wind_direction for weather in weathers],
+            [weather.temperature for weather in weathers],
+            [weather.humidity for weather in weathers],
+            [weather.pressure for weather in weathers],
+            description_code,
+            labels,
+        )
+
+    @classmethod
+    def from_api(cls, api, coordinates):
+        """
+        Crea una instancia de WeatherArray con datos de la API para varios puntos.
+
+        Los puntos se consultan de forma concurrente y los valores se vuelcan directamente en
+        arrays float32, sin crear objetos Weather intermedios.
+
+        Args:
+            api (WeatherAPI): Instancia de la API del clima.
+            coordinates (iterable): Coordenadas (lat, lon) de los puntos.
+
+        Returns:
+            WeatherArray: Las condiciones de cada punto, en el mismo orden.
+        """
+        records = api.get_weather_many(coordinates)
+        description_code, labels = _encode_descriptions(
+            record["description"] for record in records
+        )
+        columns = [
+            np.fromiter(
+                (record[field] for record in records),
+                dtype=np.float32,
+                count=len(records),
+            )
+            for field in _NUMERIC_FIELDS
+        ]
+        return cls(*columns, description_code, labels)
+
+    def impact_on_speed(self, flight_directions):
+        """
+        Calcula el impacto del viento de cada muestra en la velocidad de vuelo.
+
+        Args:
+            flight_directions (float or array-like): Dirección de vuelo en grados, común a todas
+                las muestras o una por muestra.
+
+        Returns:
+            numpy.ndarray: El impacto en la velocidad en km/h para cada muestra.
+        """
+        # Keep the whole computation in float32 so NumPy can use twice as many SIMD lanes
+        flight_directions = np.asarray(flight_directions, dtype=np.float32)
+        return self.wind_speed * np.cos(
+            (self.wind_direction - flight_directions) * _DEG2RAD_F32
         )
@@ -1,7 +1,34 @@
 import os
+import time
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
+try:
+    import orjson as _json
+except ImportError:  # orjson es opcional: el módulo json estándar también acepta bytes
+    import json as _json
+
+# Read the .env file once at import; a variable already set in the environment takes precedence
+if "API_KEY" not in os.environ:
+    load_dotenv()
+API_KEY = os.getenv("API_KEY")
+
+_REQUEST_TIMEOUT = 5  # seconds
+_CACHE_TTL = 600  # seconds; current conditions change on a scale of hours
+_CACHE_MAXSIZE = 256
+# Order of the values returned by get_weather_tuple, matching Weather's constructor
+_WEATHER_FIELDS = (
+    "wind_speed",
+    "wind_direction",
+    "temperature",
+    "humidity",
+    "pressure",
+    "description",
+)
+
 
 class WeatherAPI:
     """
@@ -13,8 +40,22 @@ class WeatherAPI:
     Atributos:
         api_key (str): La clave API para acceder a OpenWeatherMap.
         base_url (str): La URL base para las solicitudes a la API.
+
+    Todas las instancias comparten una sesión HTTP persistente y una caché de resultados, de
+    modo que las conexiones con el servidor y los datos recientes se reutilizan entre
+    llamadas y entre planes de vuelo distintos.
     """
 
+    base_url = "https://api.openweathermap.org/data/2.5/weather"
+
+    # Shared by all instances, since FlightPlan creates a new WeatherAPI for every plan.
+    # Reuse TCP/TLS connections across requests instead of opening one per call
+    _session = requests.Session()
+    _session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+    # (lat, lon) rounded to 2 decimals (~1 km) -> (expiry time, weather tuple)
+    _cache = {}
+    _cache_lock = threading.Lock()
+
     def __init__(self):
         """
         Inicializa la WeatherAPI con la clave API proporcionada.
@@ -22,43 +63,185 @@ class WeatherAPI:
         Args:
             api_key (str): La clave API para acceder a OpenWeatherMap.
         """
-        load_dotenv()  # Esto carga las variables del archivo .env
-        self.api_key = os.getenv("API_KEY")
+        self.api_key = API_KEY
         if not self.api_key:
             raise ValueError("API_KEY no está configurada en el archivo .env")
-        self.base_url = "https://api.openweathermap.org/data/2.5/weather"
 
     def get_weather(self, lat: float, lon: float):
         """
         Obtiene datos meteorológicos actuales para la latitud y longitud dadas.
 
+        Las coordenadas se redondean a 2 decimales (~1 km) y los resultados se guardan en caché
+        durante 10 minutos, de modo que los puntos cercanos consultados en una misma
+        planificación comparten una única solicitud a la API.
+
         Args:
             lat (float): La latitud de la ubicación.
             lon (float): La longitud de la ubicación.
 
         Returns:
             dict: Un diccionario con los datos meteorológicos, incluyendo velocidad del viento,
-                  dirección del viento, temperatura, humedad, presión y descripción.
+                  dirección del viento, temperatura, humedad, presión y descripción, o None si
+                  la API responde con un error (por ejemplo, una clave no válida).
+
+        Raises:
+            requests.RequestException: Si falla la conexión con la API (por ejemplo, si se
+                                       agota el tiempo de espera). Solo los errores que
+                                       devuelve la propia API se traducen en None.
+        """
+        values = self._get_weather(lat, lon, raise_errors=False)
+        return None if values is None else dict(zip(_WEATHER_FIELDS, values))
+
+    def get_weather_tuple(self, lat: float, lon: float):
+        """
+        Igual que `get_weather`, pero devuelve los datos como una tupla posicional.
+
+        Evita construir un diccionario por consulta y puede pasarse directamente al
+        constructor de Weather.
+
+        Args:
+            lat (float): La latitud de la ubicación.
+            lon (float): La longitud de la ubicación.
+
+        Returns:
+            tuple: (wind_speed, wind_direction, temperature, humidity, pressure, description),
+                   o None si la API responde con un error.
+
+        Raises:
+            requests.RequestException: Si falla la conexión con la API (por ejemplo, si se
+                                       agota el tiempo de espera). Solo los errores que
+                                       devuelve la propia API se traducen en None.
+        """
+        return self._get_weather(lat, lon, raise_errors=False)
+
+    def get_weather_or_raise(self, lat: float, lon: float):
+        """
+        Igual que `get_weather`, pero lanza una excepción si la API responde con un error.
+
+        Args:
+            lat (float): La latitud de la ubicación.
+            lon (float): La longitud de la ubicación.
+
+        Returns:
+            dict: Los datos meteorológicos, con el mismo formato que `get_weather`.
+
+        Raises:
+            requests.HTTPError: Si la API responde con un error.
+            requests.RequestException: Si falla la conexión con la API.
+        """
+        values = self._get_weather(lat, lon, raise_errors=True)
+        return dict(zip(_WEATHER_FIELDS, values))
+
+    def _get_weather(self, lat, lon, raise_errors):
+        """
+        Consulta la caché y, si no hay una entrada vigente, solicita los datos a la API.
+
+        Las respuestas con error no se guardan en la caché.
+
+        Args:
+            lat (float): La latitud de la ubicación.
+            lon (float): La longitud de la ubicación.
+            raise_errors (bool): Si es True, lanza una excepción cuando la API responde con un
+                                 error; si es False, devuelve None.
+
+        Returns:
+            tuple: Los datos meteorológicos en el orden de `get_weather_tuple`, o None si hubo
+                   un error y `raise_errors` es False.
+        """
+        key = (round(lat, 2), round(lon, 2))
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        weather = self._fetch_weather(*key, raise_errors=raise_errors)
+        if weather is None:
+            return None
+
+        with self._cache_lock:
+            self._cache.pop(key, None)
+            if len(self._cache) >= _CACHE_MAXSIZE:
+                del self._cache[next(iter(self._cache))]  # Drop the oldest entry
+            self._cache[key] = (time.monotonic() + _CACHE_TTL, weather)
+        return weather
+
+    def get_weather_many(self, coordinates, concurrency=16):
+        """
+        Obtiene datos meteorológicos actuales para varios puntos con solicitudes concurrentes.
+
+        Cada solicitud está limitada por la latencia de red, así que se lanzan hasta
+        `concurrency` a la vez sobre la sesión compartida. Los puntos que caen en la misma celda
+        de la caché (~1 km) se consultan una sola vez.
+
+        Args:
+            coordinates (iterable): Coordenadas (lat, lon) de los puntos.
+            concurrency (int, opcional): Número máximo de solicitudes simultáneas. Por defecto es 16.
+
+        Returns:
+            list: Un diccionario de datos meteorológicos por punto, en el mismo orden que
+                  `coordinates` y con el mismo formato que `get_weather`.
+
+        Raises:
+            requests.HTTPError: Si la API responde con un error para algún punto.
+            requests.RequestException: Si falla la conexión con la API.
+        """
+        keys = [(round(lat, 2), round(lon, 2)) for lat, lon in coordinates]
+        unique_keys = list(dict.fromkeys(keys))
+        if not unique_keys:
+            return []
+
+        workers = min(concurrency, len(unique_keys))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            weathers = executor.map(
+                lambda key: self._get_weather(*key, raise_errors=True), unique_keys
+            )
+            results = dict(zip(unique_keys, weathers))
+        return [dict(zip(_WEATHER_FIELDS, results[key])) for key in keys]
+
+    def _fetch_weather(self, lat, lon, raise_errors=True):
+        """
+        Solicita a la API los datos meteorológicos actuales, sin pasar por la caché.
+
+        Args:
+            lat (float): La latitud de la ubicación.
+            lon (float): La longitud de la ubicación.
+            raise_errors (bool, opcional): Si es False, devuelve None en lugar de lanzar una
+                                           excepción cuando la API responde con un error.
+                                           Por defecto es True.
+
+        Returns:
+            tuple: Los datos meteorológicos, con el mismo formato que `get_weather_tuple`.
 
         Raises:
-            Exception: Si hay un error al obtener los datos meteorológicos.
+            requests.HTTPError: Si la API responde con un error y `raise_errors` es True.
+            requests.RequestException: Si falla la conexión con la API.
         """
         params = {"lat": lat, "lon": lon, "appid": self.api_key, "units": "metric"}
 
-        response = requests.get(self.base_url, params=params)
-
-        if response.status_code == 200:
-            data = response.json()
-            return {
-                "wind_speed": data["wind"]["speed"],
-                "wind_direction": data["wind"]["deg"],
-                "temperature": data["main"]["temp"],
-                "humidity": data["main"]["humidity"],
-                "pressure": data["main"]["pressure"],
-                "description": data["weather"][0]["description"],
-            }
-        else:
-            raise Exception(f"Error fetching weather data: {response.status_code}")
+        response = self._session.get(
+            self.base_url, params=params, timeout=_REQUEST_TIMEOUT
+        )
+
+        if response.status_code != 200:
+            if raise_errors:
+                response.raise_for_status()
+                # Non-200 responses below 400 (e.g. 204 or an unfollowed 3xx) have no data
+                raise requests.HTTPError(
+                    f"Error fetching weather data: {response.status_code}",
+                    response=response,
+                )
+            return None
+
+        data = _json.loads(response.content)
+        wind = data["wind"]
+        main = data["main"]
+        return (
+            wind["speed"],
+            wind["deg"],
+            main["temp"],
+            main["humidity"],
+            main["pressure"],
+            data["weather"][0]["description"],
+        )
 
     def check_api_status(self):
         """
@@ -68,7 +251,6 @@ class WeatherAPI:
             bool: True si la API está funcionando, False en caso contrario.
         """
         try:
-            self.get_weather(51.5074, -0.1278)  # London coordinates
-            return True
+            return self.get_weather(51.5074, -0.1278) is not None  # London coordinates
         except Exception:
             return False
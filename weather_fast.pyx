@@ -0,0 +1,28 @@
+# cython: language_level=3
+"""
+Versión compilada de los cálculos escalares de `weather.py`.
+
+Se compila con `cythonize -i weather_fast.pyx`. Si el módulo no está compilado, `weather.py`
+utiliza su implementación en Python puro.
+"""
+
+from libc.math cimport cos
+
+cdef double _DEG2RAD = 0.017453292519943295
+
+
+cpdef double impact_on_speed(
+    double wind_speed, double wind_dir_rad, double flight_direction
+) nogil:
+    """
+    Componente del viento sobre la dirección de vuelo.
+
+    Args:
+        wind_speed (float): La velocidad del viento en km/h.
+        wind_dir_rad (float): La dirección del viento en radianes.
+        flight_direction (float): La dirección del vuelo en grados.
+
+    Returns:
+        float: El impacto en la velocidad en km/h.
+    """
+    return wind_speed * cos(wind_dir_rad - flight_direction * _DEG2RAD)